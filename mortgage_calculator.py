@@ -4,8 +4,44 @@ Mortgage Calculator
 Calculates monthly/annual costs and equity buildup for home purchase
 """
 import csv
-import argparse
-from datetime import datetime
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+# Schedules are stored column-wise: one list per field, indexed by position
+AmortizationSchedule = namedtuple('AmortizationSchedule', [
+    'year',
+    'principal_paid',        # This is "New Equity" - equity built this year
+    'interest_paid',
+    'remaining_balance',
+    'cumulative_principal',  # Cumulative principal paid (for total equity calc)
+])
+InvestmentGrowth = namedtuple('InvestmentGrowth', ['year', 'investment_value'])
+MortgageCosts = namedtuple('MortgageCosts', [
+    'realtor_cost',
+    'loan_amount',
+    'monthly_mortgage',
+    'annual_property_tax',
+    'monthly_property_tax',
+    'annual_insurance',
+    'monthly_insurance',
+    'monthly_total',
+    'annual_total',
+    'amortization',
+    'investment_growth',
+    'total_interest',
+    'total_paid',
+])
+
+# Annual ownership costs as a fraction of house price
+PROPERTY_TAX_RATE = 0.012
+HOME_INSURANCE_RATE = 0.004
+PROPERTY_TAX_LABEL = f'Property Tax ({PROPERTY_TAX_RATE * 100:g}%)'
+HOME_INSURANCE_LABEL = f'Home Insurance ({HOME_INSURANCE_RATE * 100:g}%)'
+
+# Bound format methods, so the format spec is parsed once rather than per value
+_format_dollars = '${:,.2f}'.format
+_format_equity_row = '{:<6} ${:>11,.0f}  ${:>11,.0f}  ${:>11,.0f}  ${:>11,.0f}'.format
 
 def parse_human_readable_number(value):
     """
@@ -34,6 +70,7 @@ def parse_human_readable_number(value):
     try:
         return float(value) * multiplier
     except ValueError:
+        import argparse
         raise argparse.ArgumentTypeError(f"Invalid number format: {value}")
 
 
@@ -42,88 +79,114 @@ def round_to_nearest_50(value):
     return round(value / 50) * 50
 
 
-def calculate_monthly_mortgage_payment(principal, annual_rate, years):
-    """Calculate monthly mortgage payment using standard formula"""
-    monthly_rate = annual_rate / 12 / 100
-    num_payments = years * 12
+def _monthly_payment_from_rate(principal, monthly_rate, num_payments):
+    """Monthly payment for an already converted monthly rate and payment count"""
+    if num_payments <= 0:
+        raise ValueError(f"Loan needs at least one payment, got {num_payments}")
 
     if monthly_rate == 0:
         return principal / num_payments
 
-    monthly_payment = principal * (monthly_rate * (1 + monthly_rate)**num_payments) / \
-                     ((1 + monthly_rate)**num_payments - 1)
-    return monthly_payment
+    # Compound growth factor is needed twice, compute it once
+    growth = (1 + monthly_rate) ** num_payments
+    return principal * monthly_rate * growth / (growth - 1)
 
 
-def generate_amortization_schedule(principal, annual_rate, years):
-    """Generate year-by-year amortization schedule"""
-    monthly_rate = annual_rate / 12 / 100
-    monthly_payment = calculate_monthly_mortgage_payment(principal, annual_rate, years)
+@lru_cache(maxsize=128)
+def calculate_monthly_mortgage_payment(principal, annual_rate, years):
+    """Calculate monthly mortgage payment using standard formula (memoized; it is pure)"""
+    return _monthly_payment_from_rate(principal, annual_rate / 12 / 100, years * 12)
+
+
+def calculate_remaining_balance(principal, monthly_rate, monthly_payment, num_payments):
+    """Calculate loan balance left after a number of payments (closed-form)"""
+    if monthly_rate == 0:
+        return principal - monthly_payment * num_payments
 
-    schedule = []
-    remaining_balance = principal
+    growth = (1 + monthly_rate) ** num_payments
+    return principal * growth - monthly_payment * (growth - 1) / monthly_rate
 
-    for year in range(1, years + 1):
-        year_principal = 0
-        year_interest = 0
 
-        for month in range(12):
-            if remaining_balance <= 0:
-                break
+def _amortization_core(principal, monthly_rate, monthly_payment, years):
+    """Year-end principal, interest and balance columns; numbers in, lists of floats out"""
+    # Columns are sized up front and filled by index
+    year_principals = [0.0] * years
+    year_interests = [0.0] * years
+    remaining_balances = [0.0] * years
+    start_balance = principal
 
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = monthly_payment - interest_payment
+    for i in range(years):
+        # Balance at each year end comes straight from the annuity formula, so there is
+        # no month-by-month loop and no drift from repeated subtraction
+        remaining_balance = max(0, calculate_remaining_balance(principal, monthly_rate,
+                                                               monthly_payment, (i + 1) * 12))
+        year_principal = start_balance - remaining_balance
+        # Interest is whatever part of the year's payments did not reduce the balance
+        year_interest = 0 if monthly_rate == 0 else monthly_payment * 12 - year_principal
+        start_balance = remaining_balance
 
-            year_principal += principal_payment
-            year_interest += interest_payment
-            remaining_balance -= principal_payment
+        year_principals[i] = year_principal
+        year_interests[i] = year_interest
+        remaining_balances[i] = remaining_balance
 
-        schedule.append({
-            'year': year,
-            'principal_paid': year_principal,  # This is "New Equity" - equity built this year
-            'interest_paid': year_interest,
-            'remaining_balance': max(0, remaining_balance),
-            'cumulative_principal': principal - remaining_balance  # Cumulative principal paid (for total equity calc)
-        })
+    return year_principals, year_interests, remaining_balances
 
-    return schedule
+
+def generate_amortization_schedule(principal, annual_rate, years):
+    """Generate year-by-year amortization schedule"""
+    if principal <= 0:
+        # Nothing is owed (down payment covers the price), so no payments are ever made
+        return AmortizationSchedule(
+            year=list(range(1, years + 1)),
+            principal_paid=[0.0] * years,
+            interest_paid=[0.0] * years,
+            remaining_balance=[0.0] * years,
+            cumulative_principal=[0.0] * years
+        )
+
+    monthly_rate = annual_rate / 12 / 100
+    # Goes through the memoized wrapper so the payment the caller already computed is reused
+    monthly_payment = calculate_monthly_mortgage_payment(principal, annual_rate, years)
+
+    year_principals, year_interests, remaining_balances = _amortization_core(
+        principal, monthly_rate, monthly_payment, years)
+
+    return AmortizationSchedule(
+        year=list(range(1, years + 1)),
+        principal_paid=year_principals,
+        interest_paid=year_interests,
+        remaining_balance=remaining_balances,
+        cumulative_principal=[principal - balance for balance in remaining_balances]
+    )
 
 
 def calculate_investment_growth(initial_investment, apr, years):
     """Calculate what initial investment would grow to if invested at APR"""
-    growth_schedule = []
+    growth_rate = 1 + apr / 100
 
-    # Year 0 - initial investment
-    growth_schedule.append({
-        'year': 0,
-        'investment_value': initial_investment
-    })
-
-    # Years 1 through loan term
-    for year in range(1, years + 1):
-        future_value = initial_investment * ((1 + apr / 100) ** year)
-        growth_schedule.append({
-            'year': year,
-            'investment_value': future_value
-        })
-    return growth_schedule
+    # Year 0 is the initial investment, then years 1 through loan term
+    return InvestmentGrowth(
+        year=list(range(years + 1)),
+        investment_value=[initial_investment * growth_rate ** year for year in range(years + 1)]
+    )
 
 
 def export_to_csv(filename, house_price, down_payment, loan_amount, mortgage_rate,
                   loan_term, monthly_mortgage, monthly_property_tax, monthly_insurance,
                   monthly_hoa, monthly_total, annual_total, amortization, investment_apr,
-                  investment_growth, closing_costs, realtor_cost):
+                  investment_growth, closing_costs, realtor_cost, total_interest, total_paid):
     """Export mortgage calculations to CSV file"""
-    with open(filename, 'w', newline='') as csvfile:
+    # Large buffer so the file is written in a few big chunks rather than per row
+    with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
         writer = csv.writer(csvfile)
 
         # Write summary section
         writer.writerow(['MORTGAGE SUMMARY'])
-        writer.writerow(['House Price', f'${house_price:,.2f}'])
-        writer.writerow(['Down Payment', f'${down_payment:,.2f}'])
-        writer.writerow(['Closing Costs', f'${closing_costs:,.2f}'])
-        writer.writerow(['Realtor Cost', f'${realtor_cost:,.2f}'])
-        writer.writerow(['Loan Amount', f'${loan_amount:,.2f}'])
+        writer.writerow(['House Price', _format_dollars(house_price)])
+        writer.writerow(['Down Payment', _format_dollars(down_payment)])
+        writer.writerow(['Closing Costs', _format_dollars(closing_costs)])
+        writer.writerow(['Realtor Cost', _format_dollars(realtor_cost)])
+        writer.writerow(['Loan Amount', _format_dollars(loan_amount)])
         writer.writerow(['Mortgage Rate', f'{mortgage_rate}%'])
         writer.writerow(['Loan Term', f'{loan_term} years'])
         writer.writerow(['Investment APR', f'{investment_apr}%'])
@@ -131,20 +194,20 @@ def export_to_csv(filename, house_price, down_payment, loan_amount, mortgage_rat
 
         # Write monthly costs
         writer.writerow(['MONTHLY COSTS'])
-        writer.writerow(['Mortgage (P&I)', f'${monthly_mortgage:,.2f}'])
-        writer.writerow(['Property Tax (1.2%)', f'${monthly_property_tax:,.2f}'])
-        writer.writerow(['Home Insurance (0.4%)', f'${monthly_insurance:,.2f}'])
-        writer.writerow(['HOA Fee', f'${monthly_hoa:,.2f}'])
-        writer.writerow(['TOTAL MONTHLY', f'${monthly_total:,.2f}'])
+        writer.writerow(['Mortgage (P&I)', _format_dollars(monthly_mortgage)])
+        writer.writerow([PROPERTY_TAX_LABEL, _format_dollars(monthly_property_tax)])
+        writer.writerow([HOME_INSURANCE_LABEL, _format_dollars(monthly_insurance)])
+        writer.writerow(['HOA Fee', _format_dollars(monthly_hoa)])
+        writer.writerow(['TOTAL MONTHLY', _format_dollars(monthly_total)])
         writer.writerow([])
 
         # Write annual costs
         writer.writerow(['ANNUAL COSTS'])
-        writer.writerow(['Mortgage (P&I)', f'${monthly_mortgage * 12:,.2f}'])
-        writer.writerow(['Property Tax', f'${monthly_property_tax * 12:,.2f}'])
-        writer.writerow(['Home Insurance', f'${monthly_insurance * 12:,.2f}'])
-        writer.writerow(['HOA Fee', f'${monthly_hoa * 12:,.2f}'])
-        writer.writerow(['TOTAL ANNUAL', f'${annual_total:,.2f}'])
+        writer.writerow(['Mortgage (P&I)', _format_dollars(monthly_mortgage * 12)])
+        writer.writerow(['Property Tax', _format_dollars(monthly_property_tax * 12)])
+        writer.writerow(['Home Insurance', _format_dollars(monthly_insurance * 12)])
+        writer.writerow(['HOA Fee', _format_dollars(monthly_hoa * 12)])
+        writer.writerow(['TOTAL ANNUAL', _format_dollars(annual_total)])
         writer.writerow([])
 
         # Write amortization schedule
@@ -152,41 +215,188 @@ def export_to_csv(filename, house_price, down_payment, loan_amount, mortgage_rat
         writer.writerow(['Year', 'Principal Paid', 'Interest Paid', 'New Equity', 'Total Equity', 'Remaining Balance', 'Investment Value (Alternative)'])
 
         # Year 0 - Initial state
-        year_0_inv = investment_growth[0]['investment_value'] if len(investment_growth) > 0 else 0
+        year_0_inv = investment_growth.investment_value[0] if investment_growth.investment_value else 0
         writer.writerow([
             0,
             '$0.00',
             '$0.00',
             '$0.00',
-            f'${down_payment:,.2f}',  # Total equity starts with down payment
-            f'${loan_amount:,.2f}',
-            f'${year_0_inv:,.2f}'
+            _format_dollars(down_payment),  # Total equity starts with down payment
+            _format_dollars(loan_amount),
+            _format_dollars(year_0_inv)
         ])
 
         # Years 1 through loan term
-        for i, entry in enumerate(amortization):
+        # Format whole columns at once, then zip them into rows
+        principal_paid = list(map(_format_dollars, amortization.principal_paid))
+        total_equity = [down_payment + cumulative for cumulative in amortization.cumulative_principal]
+        writer.writerows(zip(
+            amortization.year,
+            principal_paid,
+            map(_format_dollars, amortization.interest_paid),
+            principal_paid,  # New equity is the principal paid this year
+            map(_format_dollars, total_equity),  # Total equity includes down payment
+            map(_format_dollars, amortization.remaining_balance),
             # investment_growth has Year 0 at index 0, so Year 1 is at index 1
-            inv_value = investment_growth[i + 1]['investment_value'] if (i + 1) < len(investment_growth) else 0
-            total_equity = down_payment + entry['cumulative_principal']
-            writer.writerow([
-                entry['year'],
-                f'${entry["principal_paid"]:,.2f}',
-                f'${entry["interest_paid"]:,.2f}',
-                f'${entry["principal_paid"]:,.2f}',  # New equity is the principal paid this year
-                f'${total_equity:,.2f}',  # Total equity includes down payment
-                f'${entry["remaining_balance"]:,.2f}',
-                f'${inv_value:,.2f}'
-            ])
+            map(_format_dollars, investment_growth.investment_value[1:])
+        ))
 
         writer.writerow([])
         writer.writerow(['TOTALS'])
-        total_interest = sum(e['interest_paid'] for e in amortization)
-        total_paid = sum(e['principal_paid'] + e['interest_paid'] for e in amortization)
-        writer.writerow(['Total Interest Paid', f'${total_interest:,.2f}'])
-        writer.writerow(['Total Amount Paid', f'${total_paid:,.2f}'])
+        writer.writerow(['Total Interest Paid', _format_dollars(total_interest)])
+        writer.writerow(['Total Amount Paid', _format_dollars(total_paid)])
+
+
+def load_batch_scenarios(filename, defaults):
+    """
+    Read mortgage scenarios from a CSV file, one per row.
+    Column names match the command-line options (price, rate, term, down,
+    closing, realtor, hoa, apr); missing columns or blank cells use defaults.
+    """
+    import argparse
+
+    converters = {
+        'price': parse_human_readable_number,
+        'rate': float,
+        'term': int,
+        'down': parse_human_readable_number,
+        'closing': parse_human_readable_number,
+        'realtor': float,
+        'hoa': parse_human_readable_number,
+        'apr': float,
+    }
+
+    scenarios = []
+    # utf-8-sig drops the byte order mark spreadsheet programs put at the start of the file
+    with open(filename, newline='', encoding='utf-8-sig') as csvfile:
+        reader = csv.DictReader(csvfile)
+
+        # A misspelled or repeated column would otherwise silently fall back to defaults
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames or []]
+        unknown = [name for name in reader.fieldnames if name and name not in converters]
+        if unknown:
+            raise argparse.ArgumentTypeError(
+                f"{filename} line 1: unknown column(s): {', '.join(unknown)} "
+                f"(expected: {', '.join(converters)})")
+        duplicates = sorted({name for name in reader.fieldnames
+                             if name and reader.fieldnames.count(name) > 1})
+        if duplicates:
+            raise argparse.ArgumentTypeError(
+                f"{filename} line 1: duplicate column(s): {', '.join(duplicates)}")
+
+        for row in reader:
+            line_number = reader.line_num
+            if None in row:
+                raise argparse.ArgumentTypeError(
+                    f"{filename} line {line_number}: more values than header columns")
+
+            scenario = {}
+            for name, convert in converters.items():
+                raw = (row.get(name) or '').strip()
+                try:
+                    scenario[name] = convert(raw) if raw else defaults[name]
+                except (ValueError, argparse.ArgumentTypeError):
+                    raise argparse.ArgumentTypeError(
+                        f"{filename} line {line_number}: invalid {name} value: {raw}")
+
+            if scenario['price'] is None:
+                raise argparse.ArgumentTypeError(f"{filename} line {line_number}: missing price")
+            if scenario['term'] <= 0:
+                raise argparse.ArgumentTypeError(
+                    f"{filename} line {line_number}: term must be at least 1 year")
+            scenarios.append(scenario)
+
+    return scenarios
+
+
+def calculate_mortgage_costs(house_price, mortgage_rate, loan_term, down_payment,
+                             closing_costs, realtor_percentage, monthly_hoa, investment_apr):
+    """Calculate costs, schedules and totals for one purchase scenario"""
+    # Calculate realtor cost as percentage of house price
+    realtor_cost = house_price * (realtor_percentage / 100)
+
+    # Calculate loan amount
+    loan_amount = house_price - down_payment
+
+    # Calculate monthly mortgage payment (Principal + Interest)
+    monthly_mortgage = calculate_monthly_mortgage_payment(loan_amount, mortgage_rate, loan_term)
+
+    # Calculate property tax and home insurance from their annual rates
+    annual_property_tax = house_price * PROPERTY_TAX_RATE
+    monthly_property_tax = annual_property_tax / 12
+    annual_insurance = house_price * HOME_INSURANCE_RATE
+    monthly_insurance = annual_insurance / 12
+
+    # Calculate totals
+    monthly_total = monthly_mortgage + monthly_property_tax + monthly_insurance + monthly_hoa
+    annual_total = monthly_total * 12
+
+    # Generate amortization schedule
+    amortization = generate_amortization_schedule(loan_amount, mortgage_rate, loan_term)
+
+    # Calculate investment growth for comparison (down payment + closing costs + realtor cost)
+    total_initial_investment = down_payment + closing_costs + realtor_cost
+    investment_growth = calculate_investment_growth(total_initial_investment, investment_apr, loan_term)
+
+    total_interest = sum(amortization.interest_paid)
+    total_paid = sum(amortization.principal_paid) + total_interest
+
+    return MortgageCosts(
+        realtor_cost=realtor_cost,
+        loan_amount=loan_amount,
+        monthly_mortgage=monthly_mortgage,
+        annual_property_tax=annual_property_tax,
+        monthly_property_tax=monthly_property_tax,
+        annual_insurance=annual_insurance,
+        monthly_insurance=monthly_insurance,
+        monthly_total=monthly_total,
+        annual_total=annual_total,
+        amortization=amortization,
+        investment_growth=investment_growth,
+        total_interest=total_interest,
+        total_paid=total_paid
+    )
+
+
+def summarize_scenario(price, rate, term, down, closing, realtor, hoa, apr):
+    """Calculate the headline figures for one scenario as a CSV row"""
+    costs = calculate_mortgage_costs(price, rate, term, down, closing, realtor, hoa, apr)
+
+    return [
+        _format_dollars(price),
+        _format_dollars(down),
+        _format_dollars(closing),
+        _format_dollars(costs.realtor_cost),
+        _format_dollars(hoa),
+        f'{rate}%',
+        f'{term} years',
+        f'{apr}%',
+        _format_dollars(costs.loan_amount),
+        _format_dollars(costs.monthly_mortgage),
+        _format_dollars(costs.monthly_total),
+        _format_dollars(costs.annual_total),
+        _format_dollars(costs.total_interest),
+        _format_dollars(costs.total_paid),
+        _format_dollars(down + costs.amortization.cumulative_principal[-1]),  # Total equity at end of term
+        _format_dollars(costs.investment_growth.investment_value[-1])
+    ]
+
+
+def export_batch_to_csv(csvfile, scenarios, lineterminator='\r\n'):
+    """Write one summary row per scenario to an open CSV file"""
+    writer = csv.writer(csvfile, lineterminator=lineterminator)
+    writer.writerow(['House Price', 'Down Payment', 'Closing Costs', 'Realtor Cost', 'HOA Fee',
+                     'Mortgage Rate', 'Loan Term', 'Investment APR', 'Loan Amount',
+                     'Monthly Mortgage (P&I)', 'Total Monthly', 'Total Annual',
+                     'Total Interest Paid', 'Total Amount Paid', 'Final Total Equity',
+                     'Final Investment Value (Alternative)'])
+    writer.writerows(summarize_scenario(**scenario) for scenario in scenarios)
 
 
 def main():
+    # Imported here so using the module as a library does not pay for argparse
+    import argparse
+
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description='Calculate mortgage costs and equity buildup',
@@ -198,11 +408,12 @@ Examples:
   %(prog)s --price=1M --rate=6.5 --down=200K --closing=15K --realtor=3 --hoa=250 --apr=4.0
   %(prog)s --price=$1.5M --rate=5.99 --down=$300K --closing=$20K --realtor=2.5 --apr=3.5 --csv=results.csv
   %(prog)s --price=1,000,000 --rate=6.0 --down=200K --closing=10000 --realtor=0
+  %(prog)s --batch=scenarios.csv --rate=6.5 --csv=comparison.csv
         """
     )
 
-    # Required arguments
-    parser.add_argument('--price', type=parse_human_readable_number, required=True,
+    # Required unless --batch is given
+    parser.add_argument('--price', type=parse_human_readable_number, default=None,
                         help='House price (supports: 1M, 500K, $1.5M, 1,000,000)')
 
     # Optional arguments with defaults
@@ -230,8 +441,38 @@ Examples:
     parser.add_argument('--csv', type=str, default=None,
                         help='Export to CSV file (specify filename)')
 
+    parser.add_argument('--batch', type=str, default=None,
+                        help='Evaluate every scenario in a CSV file (columns named after the '
+                             'options above; other options act as defaults)')
+
     args = parser.parse_args()
 
+    if args.term <= 0:
+        parser.error('--term must be at least 1 year')
+
+    if args.batch:
+        try:
+            scenarios = load_batch_scenarios(args.batch, vars(args))
+        except OSError as e:
+            parser.error(f"cannot read batch file: {e}")
+        except (UnicodeDecodeError, csv.Error) as e:
+            parser.error(f"cannot parse batch file {args.batch}: {e}")
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+
+        if args.csv:
+            filename = args.csv if args.csv.endswith('.csv') else args.csv + '.csv'
+            with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+                export_batch_to_csv(csvfile, scenarios)
+            print(f"{len(scenarios)} scenario{'' if len(scenarios) == 1 else 's'} "
+                  f"exported to: {filename}")
+        else:
+            export_batch_to_csv(sys.stdout, scenarios, lineterminator='\n')
+        return
+
+    if args.price is None:
+        parser.error('the following arguments are required: --price')
+
     # Extract values from arguments
     house_price = args.price
     mortgage_rate = args.rate
@@ -242,104 +483,95 @@ Examples:
     monthly_hoa = args.hoa
     investment_apr = args.apr
 
-    # Calculate realtor cost as percentage of house price
-    realtor_cost = house_price * (realtor_percentage / 100)
-
-    print("=" * 60)
-    print("MORTGAGE CALCULATOR")
-    print("=" * 60)
-
-    # Calculate loan amount
-    loan_amount = house_price - down_payment
-
-    # Calculate monthly mortgage payment (Principal + Interest)
-    monthly_mortgage = calculate_monthly_mortgage_payment(loan_amount, mortgage_rate, loan_term)
-
-    # Calculate property tax (1.2% annually)
-    annual_property_tax = house_price * 0.012
-    monthly_property_tax = annual_property_tax / 12
-
-    # Calculate home insurance (0.4% annually)
-    annual_insurance = house_price * 0.004
-    monthly_insurance = annual_insurance / 12
-
-    # Calculate totals
-    monthly_total = monthly_mortgage + monthly_property_tax + monthly_insurance + monthly_hoa
-    annual_total = monthly_total * 12
-
-    # Generate amortization schedule
-    amortization = generate_amortization_schedule(loan_amount, mortgage_rate, loan_term)
-
-    # Calculate investment growth for comparison (down payment + closing costs + realtor cost)
-    total_initial_investment = down_payment + closing_costs + realtor_cost
-    investment_growth = calculate_investment_growth(total_initial_investment, investment_apr, loan_term)
+    # Collect the report and write it to stdout in one go
+    report = []
+    report.append("=" * 60)
+    report.append("MORTGAGE CALCULATOR")
+    report.append("=" * 60)
+
+    # Same cost model the batch mode uses
+    costs = calculate_mortgage_costs(house_price, mortgage_rate, loan_term, down_payment,
+                                     closing_costs, realtor_percentage, monthly_hoa, investment_apr)
+    realtor_cost = costs.realtor_cost
+    loan_amount = costs.loan_amount
+    monthly_mortgage = costs.monthly_mortgage
+    annual_property_tax = costs.annual_property_tax
+    monthly_property_tax = costs.monthly_property_tax
+    annual_insurance = costs.annual_insurance
+    monthly_insurance = costs.monthly_insurance
+    monthly_total = costs.monthly_total
+    annual_total = costs.annual_total
+    amortization = costs.amortization
+    investment_growth = costs.investment_growth
+    total_interest = costs.total_interest
+    total_paid = costs.total_paid
 
     # Display results
-    print("\n" + "=" * 60)
-    print("COST BREAKDOWN")
-    print("=" * 60)
-    print(f"\nHouse Price:              ${round_to_nearest_50(house_price):,.0f}")
-    print(f"Down Payment:             ${round_to_nearest_50(down_payment):,.0f}")
-    print(f"Closing Costs:            ${round_to_nearest_50(closing_costs):,.0f}")
-    print(f"Realtor Cost ({realtor_percentage}%):     ${round_to_nearest_50(realtor_cost):,.0f}")
-    print(f"Loan Amount:              ${round_to_nearest_50(loan_amount):,.0f}")
-    print(f"Mortgage Rate:            {mortgage_rate}%")
-    print(f"Loan Term:                {loan_term} years")
-    print(f"Investment APR:           {investment_apr}%")
-
-    print("\n" + "-" * 60)
-    print("MONTHLY COSTS")
-    print("-" * 60)
-    print(f"Mortgage (P&I):           ${round_to_nearest_50(monthly_mortgage):,.0f}")
-    print(f"Property Tax (1.2%):      ${round_to_nearest_50(monthly_property_tax):,.0f}")
-    print(f"Home Insurance (0.4%):    ${round_to_nearest_50(monthly_insurance):,.0f}")
-    print(f"HOA Fee:                  ${round_to_nearest_50(monthly_hoa):,.0f}")
-    print("-" * 60)
-    print(f"TOTAL MONTHLY:            ${round_to_nearest_50(monthly_total):,.0f}")
-
-    print("\n" + "-" * 60)
-    print("ANNUAL COSTS")
-    print("-" * 60)
-    print(f"Mortgage (P&I):           ${round_to_nearest_50(monthly_mortgage * 12):,.0f}")
-    print(f"Property Tax:             ${round_to_nearest_50(annual_property_tax):,.0f}")
-    print(f"Home Insurance:           ${round_to_nearest_50(annual_insurance):,.0f}")
-    print(f"HOA Fee:                  ${round_to_nearest_50(monthly_hoa * 12):,.0f}")
-    print("-" * 60)
-    print(f"TOTAL ANNUAL:             ${round_to_nearest_50(annual_total):,.0f}")
+    report.append("\n" + "=" * 60)
+    report.append("COST BREAKDOWN")
+    report.append("=" * 60)
+    report.append(f"\nHouse Price:              ${round_to_nearest_50(house_price):,.0f}")
+    report.append(f"Down Payment:             ${round_to_nearest_50(down_payment):,.0f}")
+    report.append(f"Closing Costs:            ${round_to_nearest_50(closing_costs):,.0f}")
+    report.append(f"Realtor Cost ({realtor_percentage}%):     ${round_to_nearest_50(realtor_cost):,.0f}")
+    report.append(f"Loan Amount:              ${round_to_nearest_50(loan_amount):,.0f}")
+    report.append(f"Mortgage Rate:            {mortgage_rate}%")
+    report.append(f"Loan Term:                {loan_term} years")
+    report.append(f"Investment APR:           {investment_apr}%")
+
+    report.append("\n" + "-" * 60)
+    report.append("MONTHLY COSTS")
+    report.append("-" * 60)
+    report.append(f"Mortgage (P&I):           ${round_to_nearest_50(monthly_mortgage):,.0f}")
+    report.append(f"{PROPERTY_TAX_LABEL + ':':<26}${round_to_nearest_50(monthly_property_tax):,.0f}")
+    report.append(f"{HOME_INSURANCE_LABEL + ':':<26}${round_to_nearest_50(monthly_insurance):,.0f}")
+    report.append(f"HOA Fee:                  ${round_to_nearest_50(monthly_hoa):,.0f}")
+    report.append("-" * 60)
+    report.append(f"TOTAL MONTHLY:            ${round_to_nearest_50(monthly_total):,.0f}")
+
+    report.append("\n" + "-" * 60)
+    report.append("ANNUAL COSTS")
+    report.append("-" * 60)
+    report.append(f"Mortgage (P&I):           ${round_to_nearest_50(monthly_mortgage * 12):,.0f}")
+    report.append(f"Property Tax:             ${round_to_nearest_50(annual_property_tax):,.0f}")
+    report.append(f"Home Insurance:           ${round_to_nearest_50(annual_insurance):,.0f}")
+    report.append(f"HOA Fee:                  ${round_to_nearest_50(monthly_hoa * 12):,.0f}")
+    report.append("-" * 60)
+    report.append(f"TOTAL ANNUAL:             ${round_to_nearest_50(annual_total):,.0f}")
 
     # Display equity buildup
-    print("\n" + "=" * 60)
-    print("EQUITY BUILDUP BY YEAR")
-    print("=" * 60)
-    print(f"{'Year':<6} {'New Equity':<14} {'Interest Paid':<14} {'Total Equity':<14} {'Investment Alt':<14}")
-    print("-" * 60)
+    report.append("\n" + "=" * 60)
+    report.append("EQUITY BUILDUP BY YEAR")
+    report.append("=" * 60)
+    report.append(f"{'Year':<6} {'New Equity':<14} {'Interest Paid':<14} {'Total Equity':<14} {'Investment Alt':<14}")
+    report.append("-" * 60)
 
     # Year 0 - Initial state
-    year_0_inv = investment_growth[0]['investment_value'] if len(investment_growth) > 0 else 0
-    print(f"{0:<6} "
-          f"${0:>11,.0f}  "
-          f"${0:>11,.0f}  "
-          f"${round_to_nearest_50(down_payment):>11,.0f}  "
-          f"${round_to_nearest_50(year_0_inv):>11,.0f}")
+    year_0_inv = investment_growth.investment_value[0] if investment_growth.investment_value else 0
+    report.append(_format_equity_row(0, 0, 0,
+                                     round_to_nearest_50(down_payment),
+                                     round_to_nearest_50(year_0_inv)))
 
     # Years 1 through loan term
-    for i, entry in enumerate(amortization):
-        # investment_growth has Year 0 at index 0, so Year 1 is at index 1
-        inv_value = investment_growth[i + 1]['investment_value'] if (i + 1) < len(investment_growth) else 0
-        new_equity = entry['principal_paid']  # Equity built this year
-        total_equity = down_payment + entry['cumulative_principal']  # Down payment + all principal paid
-        print(f"{entry['year']:<6} "
-              f"${round_to_nearest_50(new_equity):>11,.0f}  "
-              f"${round_to_nearest_50(entry['interest_paid']):>11,.0f}  "
-              f"${round_to_nearest_50(total_equity):>11,.0f}  "
-              f"${round_to_nearest_50(inv_value):>11,.0f}")
-
-    print("=" * 60)
-    total_interest = sum(e['interest_paid'] for e in amortization)
-    total_paid = sum(e['principal_paid'] + e['interest_paid'] for e in amortization)
-    print(f"\nTotal Interest Paid Over {loan_term} Years: ${round_to_nearest_50(total_interest):,.0f}")
-    print(f"Total Amount Paid: ${round_to_nearest_50(total_paid):,.0f}")
-    print("=" * 60)
+    # investment_growth has Year 0 at index 0, so Year 1 is at index 1
+    for year, new_equity, interest_paid, cumulative_principal, inv_value in zip(
+            amortization.year,
+            amortization.principal_paid,  # New equity is the principal paid this year
+            amortization.interest_paid,
+            amortization.cumulative_principal,
+            investment_growth.investment_value[1:]):
+        total_equity = down_payment + cumulative_principal  # Down payment + all principal paid
+        report.append(_format_equity_row(year,
+                                         round_to_nearest_50(new_equity),
+                                         round_to_nearest_50(interest_paid),
+                                         round_to_nearest_50(total_equity),
+                                         round_to_nearest_50(inv_value)))
+
+    report.append("=" * 60)
+    report.append(f"\nTotal Interest Paid Over {loan_term} Years: ${round_to_nearest_50(total_interest):,.0f}")
+    report.append(f"Total Amount Paid: ${round_to_nearest_50(total_paid):,.0f}")
+    report.append("=" * 60)
+    sys.stdout.write("\n".join(report) + "\n")
 
     # Export to CSV if requested
     if args.csv:
@@ -353,7 +585,7 @@ Examples:
             filename, house_price, down_payment, loan_amount, mortgage_rate,
             loan_term, monthly_mortgage, monthly_property_tax, monthly_insurance,
             monthly_hoa, monthly_total, annual_total, amortization, investment_apr,
-            investment_growth, closing_costs, realtor_cost
+            investment_growth, closing_costs, realtor_cost, total_interest, total_paid
         )
 
         print(f"\nData successfully exported to: {filename}")